@@ -4,7 +4,7 @@ import math
 from queue import PriorityQueue
 import time
 import random
-from main import Node, make_grid, algorithm, reconstruct_path
+from main import ALGORITHMS, Node, make_grid, algorithm, reconstruct_path, smooth_path
 
 app = Flask(__name__)
 
@@ -24,6 +24,13 @@ def pathfind():
     heuristic_type = data.get('heuristic', 'manhattan')
     allow_diagonal = data.get('allow_diagonal', False)
     speed = data.get('speed', 10)
+    algorithm_type = data.get('algorithm', 'a_star')
+    smooth = data.get('smooth', False)
+
+    if algorithm_type not in ALGORITHMS:
+        return jsonify({'status': 'failure', 'message': f'Unknown algorithm: {algorithm_type}'}), 400
+    if not isinstance(smooth, bool):
+        return jsonify({'status': 'failure', 'message': "'smooth' must be true or false"}), 400
 
     # Convert grid data to Node objects
     rows = len(grid_data)
@@ -47,11 +54,13 @@ def pathfind():
             node.update_neighbors(grid, allow_diagonal)
 
     # Run the algorithm
-    result = algorithm(lambda: None, grid, start, end, heuristic_type, speed, allow_diagonal)
+    result = algorithm(lambda: None, grid, start, end, heuristic_type, speed, allow_diagonal, algorithm_type)
 
     if result:
         came_from, end = result
         path = reconstruct_path(came_from, end, lambda: None, start, return_path=True)
+        if smooth:
+            path = smooth_path(grid, start, path)
         path_positions = [node.get_pos() for node in path]
         return jsonify({'status': 'success', 'path': path_positions})
     else:
@@ -44,6 +44,7 @@ class Node:
     def is_start(self): return self.color == COLORS["ORANGE"]
     def is_end(self): return self.color == COLORS["TURQUOISE"]
     def is_weight(self): return self.color == COLORS["WEIGHT"]
+    def is_path(self): return self.color == COLORS["PURPLE"]
     
     def reset(self):
         self.color = COLORS["WHITE"]
@@ -112,6 +113,98 @@ def reconstruct_path(came_from, current, draw, start, return_path=False):
     return path
 
 
+def line_cells(p1, p2):
+    # Bresenham-style supercover: every cell the segment between the two cell
+    # centres touches. When the line passes exactly through a corner both
+    # side cells are included, so a clear segment never passes between two
+    # barriers that touch at that corner.
+    r, c = p1
+    r1, c1 = p2
+    dr, dc = abs(r1 - r), abs(c1 - c)
+    sr = 1 if r1 > r else -1
+    sc = 1 if c1 > c else -1
+    n = dr + dc
+    error = dr - dc
+    dr *= 2
+    dc *= 2
+
+    cells = [(r, c)]
+    while n > 0:
+        if error > 0:
+            r += sr
+            error -= dc
+        elif error < 0:
+            c += sc
+            error += dr
+        else:
+            cells.append((r + sr, c))
+            cells.append((r, c + sc))
+            r += sr
+            c += sc
+            error += dr - dc
+            n -= 1
+        n -= 1
+        cells.append((r, c))
+    return cells
+
+
+def line_of_sight(grid, a, b):
+    for r, c in line_cells(a.get_pos(), b.get_pos()):
+        if grid[r][c].is_barrier():
+            return False
+    return True
+
+
+def smooth_path(grid, start, path):
+    if not path:
+        return path
+
+    # Only the shortcuts are checked: steps kept from the original path (such
+    # as diagonal moves between two barriers) stay as they were, and weights
+    # are ignored, so a shortcut may cross weighted cells.
+    smoothed = []
+    anchor = prev = start
+    for node in path:
+        if prev != anchor and not line_of_sight(grid, anchor, node):
+            smoothed.append(prev)
+            anchor = prev
+        prev = node
+    smoothed.append(path[-1])
+    return smoothed
+
+
+def expand_path(grid, start, path):
+    cells = []
+    seen = {start}
+    prev = start
+    for node in path:
+        for r, c in line_cells(prev.get_pos(), node.get_pos()):
+            cell = grid[r][c]
+            if cell not in seen:
+                seen.add(cell)
+                cells.append(cell)
+        prev = node
+    return cells
+
+
+def draw_smoothed_path(draw, grid, came_from, start, end):
+    path = reconstruct_path(came_from, end, lambda: None, start, return_path=True)
+    for row in grid:
+        for node in row:
+            if node.is_path():
+                if node.weight > 1:
+                    node.make_weight()
+                else:
+                    node.make_closed()
+
+    waypoints = smooth_path(grid, start, path)
+    for node in expand_path(grid, start, waypoints):
+        if node != start and not node.is_end():
+            node.make_path()
+    draw()
+    print(f"Smoothed path: {len(path)} -> {len(waypoints)} waypoints")
+
+
 def a_star(draw, grid, start, end, heuristic_type, speed, allow_diagonal):
     start_time = time.time()
     open_set = PriorityQueue()
@@ -144,7 +237,7 @@ def a_star(draw, grid, start, end, heuristic_type, speed, allow_diagonal):
             elapsed = time.time() - start_time
             path_length = len(reconstruct_path(came_from, end, lambda: None, start, return_path=True))
             show_stats(elapsed, explored, path_length)
-            return True
+            return came_from, end
 
         for neighbor in current.neighbors:
             temp_g_score = g_score[current] + current.weight
@@ -199,7 +292,7 @@ def dijkstra(draw, grid, start, end, speed):
             elapsed = time.time() - start_time
             path_length = len(reconstruct_path(came_from, end, lambda: None, start, return_path=True))
             show_stats(elapsed, explored, path_length)
-            return True
+            return came_from, end
 
         for neighbor in current.neighbors:
             temp_g_score = g_score[current] + current.weight
@@ -252,7 +345,7 @@ def greedy_best_first(draw, grid, start, end, heuristic_type, speed):
             elapsed = time.time() - start_time
             path_length = len(reconstruct_path(came_from, end, lambda: None, start, return_path=True))
             show_stats(elapsed, explored, path_length)
-            return True
+            return came_from, end
 
         for neighbor in current.neighbors:
             temp_g_score = g_score[current] + current.weight
@@ -300,7 +393,7 @@ def dfs(draw, grid, start, end, speed):
             elapsed = time.time() - start_time
             path_length = len(reconstruct_path(came_from, end, lambda: None, start, return_path=True))
             show_stats(elapsed, explored, path_length)
-            return True
+            return came_from, end
 
         for neighbor in current.neighbors:
             if neighbor not in visited:
@@ -342,7 +435,7 @@ def bfs(draw, grid, start, end, speed):
             elapsed = time.time() - start_time
             path_length = len(reconstruct_path(came_from, end, lambda: None, start, return_path=True))
             show_stats(elapsed, explored, path_length)
-            return True
+            return came_from, end
 
         for neighbor in current.neighbors:
             if neighbor not in visited:
@@ -363,8 +456,101 @@ def bfs(draw, grid, start, end, speed):
     return False
 
 
+def theta_star(draw, grid, start, end, speed, allow_diagonal, lazy=False):
+    # Any-angle A*: a node may take its grandparent as parent when the two can
+    # see each other, so came_from links waypoints rather than adjacent cells.
+    # Lazy Theta* defers the line-of-sight check until the node is expanded.
+    start_time = time.time()
+    open_set = PriorityQueue()
+    open_set.put((0, 0, start))
+    came_from = {}
+
+    g_score = {node: float("inf") for row in grid for node in row}
+    g_score[start] = 0
+
+    closed = set()
+    count = 1
+    explored = 0
+
+    def dist(a, b):
+        return get_heuristic(a.get_pos(), b.get_pos(), "euclidean")
+
+    while not open_set.empty():
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                return False
+
+        current = open_set.get()[2]
+        if current in closed:
+            continue
+        closed.add(current)
+        explored += 1
+
+        if lazy and current != start and not line_of_sight(grid, came_from[current], current):
+            best = min((n for n in current.neighbors
+                        if n in closed and line_of_sight(grid, n, current)),
+                       key=lambda n: g_score[n] + dist(n, current))
+            came_from[current] = best
+            g_score[current] = g_score[best] + dist(best, current)
+
+        if current == end:
+            path = reconstruct_path(came_from, end, lambda: None, start, return_path=True)
+            for node in expand_path(grid, start, path):
+                if node != start and not node.is_end():
+                    node.make_path()
+                    draw()
+            end.make_end()
+            # Count grid steps along each segment so the stat matches the
+            # other algorithms instead of counting waypoints.
+            steps = 0
+            prev = start
+            for node in path:
+                dr = abs(node.row - prev.row)
+                dc = abs(node.col - prev.col)
+                steps += max(dr, dc) if allow_diagonal else dr + dc
+                prev = node
+            show_stats(time.time() - start_time, explored, steps)
+            return came_from, end
+
+        parent = came_from.get(current, current)
+        for neighbor in current.neighbors:
+            # Diagonal steps between two barriers are not a clear segment.
+            if neighbor in closed or not line_of_sight(grid, current, neighbor):
+                continue
+            if lazy or (parent != current and line_of_sight(grid, parent, neighbor)):
+                source = parent
+            else:
+                source = current
+            temp_g_score = g_score[source] + dist(source, neighbor)
+            if temp_g_score < g_score[neighbor]:
+                came_from[neighbor] = source
+                g_score[neighbor] = temp_g_score
+                count += 1
+                open_set.put((temp_g_score + dist(neighbor, end), count, neighbor))
+                neighbor.make_open()
+
+        if speed > 0:
+            time.sleep(speed/1000)
+
+        draw()
+
+        if current != start:
+            current.make_closed()
+
+    show_stats(time.time()-start_time, explored, 0)
+    return False
+
+
+ALGORITHMS = ("a_star", "dijkstra", "greedy", "dfs", "bfs", "theta", "lazy_theta")
+
+
 def algorithm(draw, grid, start, end, heuristic_type, speed, allow_diagonal, algorithm_type="a_star"):
-    if algorithm_type == "dijkstra":
+    if algorithm_type == "theta":
+        return theta_star(draw, grid, start, end, speed, allow_diagonal)
+    elif algorithm_type == "lazy_theta":
+        return theta_star(draw, grid, start, end, speed, allow_diagonal, lazy=True)
+    elif algorithm_type == "dijkstra":
         return dijkstra(draw, grid, start, end, speed)
     elif algorithm_type == "greedy":
         return greedy_best_first(draw, grid, start, end, heuristic_type, speed)
@@ -372,8 +558,9 @@ def algorithm(draw, grid, start, end, heuristic_type, speed, allow_diagonal, alg
         return dfs(draw, grid, start, end, speed)
     elif algorithm_type == "bfs":
         return bfs(draw, grid, start, end, speed)
-    else:
+    elif algorithm_type == "a_star":
         return a_star(draw, grid, start, end, heuristic_type, speed, allow_diagonal)
+    raise ValueError(f"Unknown algorithm: {algorithm_type}")
 
 
 def show_stats(time_taken, nodes_explored, path_length):
@@ -455,12 +642,15 @@ class CommandWindow:
             ("3", "Greedy Best-First Search"),
             ("4", "Depth First Search"),
             ("5", "Breadth First Search"),
+            ("6", "Theta* (any-angle)"),
+            ("7", "Lazy Theta* (any-angle)"),
             ("", ""),
             ("Options:", ""),
             ("C", "Clear Grid"),
             ("D", "Toggle Diagonal Movement"),
             ("H", "Change Heuristic"),
             ("S", "Change Speed"),
+            ("P", "Toggle Path Smoothing"),
             ("R", "Generate Random Maze")
         ]
         
@@ -501,6 +691,7 @@ def main(win, width):
     speed = 10
     allow_diagonal = False
     algorithm_type = "a_star"
+    smooth = False
     running = True
 
     while running:
@@ -540,8 +731,12 @@ def main(win, width):
                     for row in grid:
                         for node in row:
                             node.update_neighbors(grid, allow_diagonal)
-                    algorithm(lambda: draw(win, grid, ROWS, width, command_window),
+                    result = algorithm(lambda: draw(win, grid, ROWS, width, command_window),
                             grid, start, end, heuristic_type, speed, allow_diagonal, algorithm_type)
+                    if result and smooth:
+                        came_from, _ = result
+                        draw_smoothed_path(lambda: draw(win, grid, ROWS, width, command_window),
+                                           grid, came_from, start, end)
 
                 if event.key == pygame.K_c:
                     start = end = None
@@ -561,6 +756,10 @@ def main(win, width):
                     speed = (speed + 20) % 110
                     print(f"Animation speed: {speed}ms delay")
 
+                if event.key == pygame.K_p:
+                    smooth = not smooth
+                    print(f"Path smoothing: {smooth}")
+
                 if event.key == pygame.K_r:
                     generate_random_maze(grid, ROWS)
 
@@ -584,6 +783,14 @@ def main(win, width):
                     algorithm_type = "bfs"
                     print("Algorithm: Breadth First Search")
 
+                if event.key == pygame.K_6:
+                    algorithm_type = "theta"
+                    print("Algorithm: Theta*")
+
+                if event.key == pygame.K_7:
+                    algorithm_type = "lazy_theta"
+                    print("Algorithm: Lazy Theta*")
+
     pygame.quit()
 
 
@@ -0,0 +1,15 @@
+import os
+import sys
+import types
+
+# main.py opens a window on import, so tests always run against a stub.
+pygame = types.ModuleType("pygame")
+pygame.QUIT = object()
+pygame.init = lambda: None
+pygame.quit = lambda: None
+pygame.display = types.SimpleNamespace(set_mode=lambda *args: None,
+                                       set_caption=lambda *args: None)
+pygame.event = types.SimpleNamespace(get=lambda: [])
+sys.modules["pygame"] = pygame
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "bin"))
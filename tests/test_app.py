@@ -0,0 +1,40 @@
+import pytest
+
+pytest.importorskip("flask")
+
+from app import app
+
+
+def post(**fields):
+    grid = [["empty"] * 6 for _ in range(6)]
+    grid[0][0] = "start"
+    grid[5][5] = "end"
+    body = {"grid": grid, "start": [0, 0], "end": [5, 5], "speed": 0}
+    body.update(fields)
+    return app.test_client().post("/pathfind", json=body)
+
+
+def test_unknown_algorithm_is_rejected():
+    response = post(algorithm="not_a_star")
+    assert response.status_code == 400
+    assert response.get_json()["status"] == "failure"
+
+
+@pytest.mark.parametrize("smooth", ["false", 0, None])
+def test_smooth_must_be_bool(smooth):
+    response = post(smooth=smooth)
+    assert response.status_code == 400
+    assert response.get_json()["status"] == "failure"
+
+
+def test_smoothed_theta_star_returns_single_segment():
+    response = post(algorithm="theta", smooth=True, allow_diagonal=True)
+    assert response.status_code == 200
+    assert response.get_json() == {"status": "success", "path": [[5, 5]]}
+
+
+def test_smoothing_reduces_a_star_waypoints():
+    raw = post(algorithm="a_star").get_json()["path"]
+    smoothed = post(algorithm="a_star", smooth=True).get_json()["path"]
+    assert smoothed[-1] == raw[-1] == [5, 5]
+    assert len(smoothed) < len(raw)
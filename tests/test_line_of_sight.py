@@ -0,0 +1,207 @@
+import contextlib
+import io
+import random
+from fractions import Fraction
+
+import pytest
+
+import main
+from main import (algorithm, bfs, draw_smoothed_path, expand_path,
+                  generate_random_maze, line_cells, line_of_sight, make_grid,
+                  reconstruct_path, smooth_path, theta_star)
+
+
+def supercover(p1, p2):
+    # Every cell whose closed square touches the segment between the centres.
+    (r0, c0), (r1, c1) = p1, p2
+    half = Fraction(1, 2)
+    cells = set()
+    for r in range(min(r0, r1), max(r0, r1) + 1):
+        for c in range(min(c0, c1), max(c0, c1) + 1):
+            lo, hi = Fraction(0), Fraction(1)
+            for start, delta, low, high in ((r0, r1 - r0, r - half, r + half),
+                                            (c0, c1 - c0, c - half, c + half)):
+                if delta == 0:
+                    if not low <= start <= high:
+                        lo, hi = 1, 0
+                    continue
+                t1 = Fraction(low - start, delta)
+                t2 = Fraction(high - start, delta)
+                lo, hi = max(lo, min(t1, t2)), min(hi, max(t1, t2))
+            if lo <= hi:
+                cells.add((r, c))
+    return cells
+
+
+def make_world(rows, allow_diagonal=False, maze=False):
+    grid = make_grid(rows, rows * 10)
+    if maze:
+        generate_random_maze(grid, rows)
+    start, end = grid[0][0], grid[rows - 1][rows - 1]
+    start.reset()
+    end.reset()
+    start.make_start()
+    end.make_end()
+    for row in grid:
+        for node in row:
+            node.update_neighbors(grid, allow_diagonal)
+    return grid, start, end
+
+
+def test_line_cells_straight():
+    assert line_cells((2, 1), (2, 4)) == [(2, 1), (2, 2), (2, 3), (2, 4)]
+
+
+def test_line_cells_diagonal_includes_side_cells():
+    assert line_cells((0, 0), (2, 2)) == [(0, 0), (1, 0), (0, 1), (1, 1),
+                                          (2, 1), (1, 2), (2, 2)]
+
+
+def test_line_cells_zero_length():
+    assert line_cells((3, 3), (3, 3)) == [(3, 3)]
+
+
+def test_line_cells_negative_direction():
+    assert line_cells((3, 2), (0, 0)) == [(3, 2), (2, 2), (2, 1), (1, 1), (1, 0), (0, 0)]
+    assert set(line_cells((3, 2), (0, 0))) == set(line_cells((0, 0), (3, 2)))
+
+
+def test_line_cells_matches_geometric_supercover():
+    rng = random.Random(0)
+    for _ in range(500):
+        p1 = (rng.randrange(-10, 10), rng.randrange(-10, 10))
+        p2 = (rng.randrange(-10, 10), rng.randrange(-10, 10))
+        cells = line_cells(p1, p2)
+        assert len(cells) == len(set(cells))
+        assert set(cells) == supercover(p1, p2), (p1, p2)
+
+
+def test_line_of_sight_blocked_by_corner():
+    grid, start, end = make_world(5)
+    grid[1][0].make_barrier()
+    assert not line_of_sight(grid, grid[0][0], grid[2][2])
+    assert line_of_sight(grid, grid[0][0], grid[0][4])
+
+
+# Seeds whose 20x20 random maze has a path from corner to corner.
+SOLVABLE_SEEDS = [1, 2, 3, 4, 5, 6, 10, 11, 12, 13, 14, 17]
+
+
+def run_quietly(search, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return search(lambda: None, *args, **kwargs)
+
+
+def barrier_cells(grid):
+    # Taken before a search, since drawing the result repaints the grid.
+    return {node.get_pos() for row in grid for node in row if node.is_barrier()}
+
+
+def assert_segments_clear(barriers, start, waypoints):
+    prev = start
+    for node in waypoints:
+        blocked = barriers.intersection(line_cells(prev.get_pos(), node.get_pos()))
+        assert not blocked, (prev.get_pos(), node.get_pos())
+        prev = node
+
+
+@pytest.mark.parametrize("seed", SOLVABLE_SEEDS)
+def test_smoothed_segments_have_line_of_sight(seed):
+    random.seed(seed)
+    grid, start, end = make_world(20, maze=True)
+    barriers = barrier_cells(grid)
+    result = run_quietly(bfs, grid, start, end, 0)
+    assert result
+
+    path = reconstruct_path(result[0], end, lambda: None, start, return_path=True)
+    smoothed = smooth_path(grid, start, path)
+    assert smoothed[-1] is end
+    assert len(smoothed) < len(path)
+    assert_segments_clear(barriers, start, smoothed)
+
+
+@pytest.mark.parametrize("allow_diagonal", [False, True])
+@pytest.mark.parametrize("lazy", [False, True])
+@pytest.mark.parametrize("seed", SOLVABLE_SEEDS)
+def test_theta_star_maze_segments_have_line_of_sight(seed, lazy, allow_diagonal):
+    random.seed(seed)
+    grid, start, end = make_world(20, allow_diagonal=allow_diagonal, maze=True)
+    barriers = barrier_cells(grid)
+    result = run_quietly(theta_star, grid, start, end, 0, allow_diagonal, lazy=lazy)
+    assert result
+
+    path = reconstruct_path(result[0], end, lambda: None, start, return_path=True)
+    assert path[-1] is end
+    assert_segments_clear(barriers, start, path)
+    assert_segments_clear(barriers, start, smooth_path(grid, start, path))
+
+
+def test_lazy_theta_star_repairs_parent(monkeypatch):
+    failures = []
+
+    def recording_line_of_sight(grid, a, b):
+        visible = line_of_sight(grid, a, b)
+        if not visible:
+            failures.append((a, b))
+        return visible
+
+    monkeypatch.setattr(main, "line_of_sight", recording_line_of_sight)
+    # A wall with a gap: the straight line from start is blocked, so the
+    # parent guessed for cells behind the wall has to be repaired.
+    grid, start, end = make_world(10)
+    for col in range(9):
+        grid[5][col].make_barrier()
+    for row in grid:
+        for node in row:
+            node.update_neighbors(grid)
+    barriers = barrier_cells(grid)
+    result = run_quietly(theta_star, grid, start, end, 0, False, lazy=True)
+    assert result
+    assert failures
+
+    path = reconstruct_path(result[0], end, lambda: None, start, return_path=True)
+    assert path[-1] is end
+    assert_segments_clear(barriers, start, path)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_theta_star_empty_grid_is_single_segment(lazy):
+    grid, start, end = make_world(10, allow_diagonal=True)
+    with contextlib.redirect_stdout(io.StringIO()):
+        came_from, _ = theta_star(lambda: None, grid, start, end, 0, True, lazy=lazy)
+    assert reconstruct_path(came_from, end, lambda: None, start, return_path=True) == [end]
+
+
+@pytest.mark.parametrize("allow_diagonal, expected", [(True, 9), (False, 18)])
+def test_theta_star_reports_grid_steps(allow_diagonal, expected):
+    grid, start, end = make_world(10, allow_diagonal=allow_diagonal)
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        theta_star(lambda: None, grid, start, end, 0, allow_diagonal)
+    assert f"Path length: {expected}\n" in out.getvalue()
+
+
+def test_algorithm_rejects_unknown_name():
+    grid, start, end = make_world(5)
+    with pytest.raises(ValueError):
+        algorithm(lambda: None, grid, start, end, "manhattan", 0, False, "not_a_star")
+
+
+def test_draw_smoothed_path_restores_weights():
+    grid, start, end = make_world(4)
+    grid[0][2].make_weight()
+    # A detour along the top row and down the right side; the smoothed
+    # diagonal no longer touches (0, 2).
+    cells = [(0, 1), (0, 2), (0, 3), (1, 3), (2, 3), (3, 3)]
+    came_from = {}
+    prev = start
+    for r, c in cells:
+        came_from[grid[r][c]] = prev
+        prev = grid[r][c]
+    reconstruct_path(came_from, end, lambda: None, start)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        draw_smoothed_path(lambda: None, grid, came_from, start, end)
+    assert grid[0][2].is_weight() and grid[0][2].weight == 5
+    assert grid[0][3].is_closed()
+    assert grid[1][1].is_path() and grid[2][2].is_path()